@@ -5,6 +5,7 @@ such that the array buffer can be converted back to the original data objects.
 
 from datetime import datetime
 import numpy
+from numpy.lib.format import dtype_to_descr
 from .utils import is_dask_array
 from . import __version__
 
@@ -30,7 +31,7 @@ def get_array_attrs(data):
         "shape": data.shape,
         "dtype": data.dtype,
         "fortran_order": fortran_order,
-        "descr": numpy.lib.format.dtype_to_descr(data.dtype),
+        "descr": dtype_to_descr(data.dtype),
         "nbytes": data.nbytes,
     }
 
@@ -5,6 +5,7 @@ Domain Decomposition
 __all__ = ["Decomposition"]
 
 import numpy
+from .utils import get_mpi
 
 
 class Decomposition:
@@ -19,10 +20,7 @@ class Decomposition:
         """
         Property for importing MPI wherever necessary
         """
-        # pylint: disable=C0415
-        from mpi4py import MPI
-
-        return MPI
+        return get_mpi()
 
     def __init__(self, comm=None):
         if (comm is None) or (not isinstance(comm, self.MPI.Comm)):
@@ -40,6 +38,33 @@ class Decomposition:
             self.dims = [self.size]
             self.coords = [self.rank]
 
+        self._subcomms = []
+
+    def free(self):
+        """
+        Frees the sub-communicators. Collective over the communicator,
+        so it must be called by all the processes.
+        """
+        for subcomm in self._subcomms:
+            subcomm.Free()
+        self._subcomms = []
+
+    @property
+    def subcomms(self):
+        """
+        Sub-communicators for collective communications over a single
+        dimension of the topology. Created once on first usage.
+        """
+        if self.comm.topology is not self.MPI.CART:
+            return [self.comm]
+        if not self._subcomms:
+            ndims = len(self.dims)
+            self._subcomms = [
+                self.comm.Sub(remain_dims=[i == dim for i in range(ndims)])
+                for dim in range(ndims)
+            ]
+        return self._subcomms
+
     def decompose(self, domain):
         """
         Decompose data over a cartesian/normal communicator.
@@ -67,27 +92,29 @@ class Decomposition:
                     len(domain), len(self.dims)
                 )
             )
-        sizes = list(domain)
-        sub_sizes = list(domain)
-        starts = [0] * len(domain)
-
-        # Iterating over the dimensions of the topology
-        # allows for decomposition of higher order data domains
-        for dim in range(len(self.dims)):
-            workers, proc_id = self.dims[dim], self.coords[dim]
-            if domain[dim] < workers:
-                raise ValueError(
-                    f"Domain size ({domain[dim]}) for dimension {dim} must be \
-                        larger than the amount of workers({workers})"
-                )
+        ndims = len(self.dims)
+        workers = numpy.asarray(self.dims)
+        proc_id = numpy.asarray(self.coords)
+        load = numpy.asarray(domain[:ndims])
+
+        too_small = numpy.flatnonzero(load < workers)
+        if too_small.size > 0:
+            dim = too_small[0]
+            raise ValueError(
+                f"Domain size ({domain[dim]}) for dimension {dim} must be "
+                f"larger than the amount of workers ({workers[dim]})"
+            )
 
-            low = _split_work(domain[dim], workers, proc_id)
-            high = _split_work(domain[dim], workers, proc_id + 1)
+        # Decomposing all the dimensions of the topology at once.
+        # Higher order dimensions of the data domain are left untouched.
+        low = _split_work(load, workers, proc_id)
+        high = _split_work(load, workers, proc_id + 1)
 
-            sub_sizes[dim] = high - low
-            starts[dim] = low
+        sizes = tuple(domain)
+        sub_sizes = tuple((high - low).tolist()) + sizes[ndims:]
+        starts = tuple(low.tolist()) + (0,) * (len(domain) - ndims)
 
-        return tuple(sizes), tuple(sub_sizes), tuple(starts)
+        return sizes, sub_sizes, starts
 
     def compose(self, domain):
         """
@@ -118,55 +145,41 @@ class Decomposition:
             )
 
         sizes = list(domain)
-        sub_sizes = list(domain)
         starts = [0] * len(domain)
 
-        # Iterating over the dimensions of the topology
-        # allows for composition of higher order data domains
-        for dim in range(len(self.dims)):
-            rdims = [False] * len(self.dims)
-            rdims[dim] = True
-
-            # sub-communicator for collective communications over
-            # a single dimension in the topology
-            if self.comm.topology is self.MPI.CART:
-                subcomm = self.comm.Sub(remain_dims=rdims)
-            else:
-                subcomm = self.comm
+        # One gather per dimension of the topology, over the processes along
+        # that dimension only, i.e. O(P^(1/ndims)) data per process.
+        # Higher order dimensions of the data domain are left untouched.
+        for dim, subcomm in enumerate(self.subcomms):
+            sub_size = numpy.empty(subcomm.size, dtype="int64")
+            subcomm.Allgather(numpy.array(domain[dim], dtype="int64"), sub_size)
+            sizes[dim] = int(sub_size.sum())
+            starts[dim] = int(sub_size[: self.coords[dim]].sum())
 
-            sub_size = subcomm.allgather(sub_sizes[dim])
-            sizes[dim] = sum(sub_size)
-            starts[dim] = numpy.cumsum([0] + sub_size)[self.coords[dim]]
-
-        return tuple(sizes), tuple(sub_sizes), tuple(starts)
+        return tuple(sizes), tuple(domain), tuple(starts)
 
 
 def _split_work(load, workers, proc_id):
     """
     Uniformly distributes load over the dimension.
-    Remaining load is assigned in reverse round robin manner
+    Remaining load is assigned in reverse round robin manner.
+    Works element-wise on arrays, i.e. over several dimensions at once.
 
     Parameters
     ----------
-    load : int
+    load : int or numpy array
         load size to be assigned
-    workers : int
+    workers : int or numpy array
         total processing elements work will be assigned to
-    proc_id : int
+    proc_id : int or numpy array
         processing element for which the bound is calculated for
 
     Returns:
     --------
-    bound : int
+    bound : int or numpy array
         low bound of the workload assigned to the worker
     """
-    unifload = load // workers  # uniform distribution
-    rem = load - unifload * workers
+    unifload, rem = numpy.divmod(load, workers)  # uniform distribution
 
     # round-robin assignment of the remaining work
-    if proc_id <= rem:
-        bound = (unifload + 1) * proc_id
-    else:
-        bound = (unifload + 1) * rem + unifload * (proc_id - rem)
-
-    return bound
+    return unifload * proc_id + numpy.minimum(proc_id, rem)
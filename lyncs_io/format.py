@@ -69,6 +69,18 @@ class Format:
 class Formats(OrderedDict):
     "Collection of formats"
 
+    _extensions = None
+
+    @property
+    def extensions(self):
+        "Map of the known extensions to the first registered format using them"
+        if self._extensions is None:
+            self._extensions = {}
+            for format in self.values():
+                for ext in format.extensions:
+                    self._extensions.setdefault(ext, format)
+        return self._extensions
+
     def from_format(self, format):
         "Returns a format from the given format"
         if isinstance(format, Format):
@@ -87,9 +99,8 @@ class Formats(OrderedDict):
         suffix = ""
         for part in reversed(suffixes):
             suffix += part
-            for format in self.values():
-                if suffix[1:] in format.extensions:
-                    return format
+            if suffix[1:] in self.extensions:
+                return self.extensions[suffix[1:]]
         raise ValueError(f"Could not deduce the format from the suffix: {suffix}")
 
     def from_path(self, path):
@@ -135,6 +146,8 @@ class Formats(OrderedDict):
         fmt = Format(names[0], alias=names[1:], **kwargs)
         for name in names:
             self[name.lower()] = fmt
+        # resetting the extensions index
+        self._extensions = None
 
     def __str__(self):
         return ", ".join(self.keys())
@@ -131,7 +131,9 @@ def _write_dataset(grp, key, data, comm=None, **kwargs):
         data = data.astype("S")
 
     if comm is not None:
-        global_shape, subsizes, starts = Decomposition(comm=comm).compose(data.shape)
+        decomposition = Decomposition(comm=comm)
+        global_shape, subsizes, starts = decomposition.compose(data.shape)
+        decomposition.free()
         slc = tuple(slice(start, start + size) for start, size in zip(starts, subsizes))
         dset = grp.create_dataset(key, global_shape, dtype=data.dtype)
         dset[slc] = data
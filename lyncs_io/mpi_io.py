@@ -5,6 +5,7 @@ Parallel IO using MPI
 __all__ = ["MpiIO"]
 
 from contextlib import contextmanager
+from functools import lru_cache
 import tempfile
 import os
 import numpy
@@ -18,7 +19,8 @@ except ImportError:
     with_mpi = False
 
 
-from .decomposition import Decomposition
+from .decomposition import Decomposition, _split_work
+from .utils import get_mpi
 
 
 def check_comm(comm):
@@ -34,7 +36,7 @@ def _tempdir_MPI(comm=None):
     Creates a temporary directory to be used during testing
     """
 
-    from mpi4py import MPI
+    MPI = get_mpi()
 
     if comm is None:
         comm = MPI.COMM_WORLD
@@ -66,44 +68,122 @@ def _tempdir_MPI(comm=None):
 tempdir_MPI = contextmanager(_tempdir_MPI)
 
 
+@lru_cache(maxsize=None)
+def _mpi_typedict():
+    """
+    Returns a dictionary mapping numpy data types to the pair (key, MPI type)
+    of the mpi4py types dict. It is built only once on first usage.
+    """
+    MPI = get_mpi()
+
+    if hasattr(MPI, "_typedict"):
+        types = MPI._typedict
+    elif hasattr(MPI, "__TypeDict__"):
+        types = MPI.__TypeDict__
+    else:
+        raise RuntimeError("Types dict not found")
+
+    typedict = {}
+    for key, val in types.items():
+        try:
+            typedict.setdefault(numpy.dtype(key), (key, val))
+        # for keys that are not understood
+        except TypeError:
+            continue
+
+    return typedict
+
+
+@lru_cache(maxsize=None)
+def _mpi_file_modes():
+    "Returns a dictionary mapping file mode strings to MPI file modes"
+    MPI = get_mpi()
+
+    return {
+        "r": MPI.MODE_RDONLY,
+        "w": MPI.MODE_CREATE | MPI.MODE_WRONLY,
+        "a": MPI.MODE_APPEND,
+        "r+": MPI.MODE_RDWR,
+        "w+": MPI.MODE_CREATE | MPI.MODE_RDWR,
+    }
+
+
+@lru_cache(maxsize=None)
+def _mpi_file_flags():
+    "Returns the bitwise OR of all the valid MPI file modes"
+    MPI = get_mpi()
+
+    return (
+        MPI.MODE_RDONLY
+        | MPI.MODE_RDWR
+        | MPI.MODE_WRONLY
+        | MPI.MODE_CREATE
+        | MPI.MODE_EXCL
+        | MPI.MODE_DELETE_ON_CLOSE
+        | MPI.MODE_UNIQUE_OPEN
+        | MPI.MODE_SEQUENTIAL
+        | MPI.MODE_APPEND
+    )
+
+
 class MpiIO:
     """
     Class for handling file handling routines and Parallel IO using MPI
+
+    Attributes
+    ----------
+    pipeline_nbytes : int
+        Reads larger than this size (per process) are split along the
+        slowest index into several non-blocking collective reads.
+    max_filetypes : int
+        Number of committed subarray filetypes kept for reuse.
     """
 
+    pipeline_nbytes = 64 * 2**20
+    max_filetypes = 16
+
     # pylint: disable=C0103
     @property
     def MPI(self):
         """
         Property for importing MPI wherever necessary
         """
-        # pylint: disable=C0415
-        try:
-            from mpi4py import MPI
-        except ImportError as err:
-            raise ImportError(
-                "MPI not available. Consider installing `lyncs_io[mpi]`."
-            ) from err
-
-        return MPI
+        return get_mpi()
 
     def __init__(self, comm, filename, mode="r"):
+        # first, so that __del__ does not fail if the constructor raises
+        self._filetypes = {}
 
         self.decomposition = Decomposition(comm=comm)
-
-        self.comm = self.decomposition.comm
-        self.rank = self.decomposition.rank
-        self.size = self.decomposition.size
         self.filename = filename
         self.handler = None
         self.mode = mode
 
+    @property
+    def comm(self):
+        "The communicator of the decomposition"
+        return self.decomposition.comm
+
+    @property
+    def rank(self):
+        "The rank of the process in the communicator"
+        return self.decomposition.rank
+
+    @property
+    def size(self):
+        "The number of processes in the communicator"
+        return self.decomposition.size
+
+    def __del__(self):
+        self._free_filetypes()
+
     def __enter__(self):
         self._file_open(mode=self.mode)
         return self
 
     def __exit__(self, exc_type, exc_val, traceback):
         self._file_close()
+        self.decomposition.free()
 
     def load(self, domain, dtype, order, header_offset):
         """
@@ -128,18 +208,60 @@ class MpiIO:
             Local data to the process
         """
 
-        # skip header
-        pos = self.handler.Get_position() + header_offset
+        reqs, local_array = self.load_async(domain, dtype, order, header_offset)
+        self.MPI.Request.Waitall(reqs)
+
+        return local_array
+
+    def load_async(self, domain, dtype, order, header_offset):
+        """
+        Starts a non-blocking collective read of the local domain.
+        Same parameters as `load`.
+
+        The returned requests must be completed, e.g. with
+        `MPI.Request.Waitall`, before accessing the array or closing the file.
+        Large reads are split in slabs (see `pipeline_nbytes`), one request each.
 
-        self._set_view(domain, dtype, order, pos)
+        Returns:
+        --------
+        reqs : list of MPI.Request
+            Requests of the pending reads
+        local_array : numpy array
+            Local data to the process, valid once the requests are completed
+        """
+
+        # skip header (the offset is relative to the beginning of the file
+        # so that the same handler can be used for repeated loads)
+        offset = self._set_view(domain, dtype, order, header_offset)
 
         # allocate space for local_array to hold data read from file
         _, subsizes, _ = self.decomposition.decompose(domain)
         local_array = numpy.empty(subsizes, dtype=dtype, order=order.upper())
+        buffer = self._array_view(local_array)
 
-        self.handler.Read_all(self._array_view(local_array))
+        # slabs along the slowest index are contiguous in the view
+        rowsize = int(numpy.prod(subsizes[1:], dtype=int))
+        nslabs = self._get_nslabs(domain, dtype)
+        bounds = _split_work(subsizes[0], nslabs, numpy.arange(nslabs + 1)).tolist()
 
-        return local_array
+        reqs = [
+            self.handler.Iread_at_all(offset + low * rowsize, buffer[low:high])
+            for low, high in zip(bounds[:-1], bounds[1:])
+        ]
+
+        return reqs, local_array
+
+    def _get_nslabs(self, domain, dtype):
+        """
+        Number of slabs the local domain is read in. It is computed from
+        the global domain, so that all processes issue the same number of
+        collective calls.
+        """
+        dims = self.decomposition.dims
+        max_shape = [-(-size // procs) for size, procs in zip(domain, dims)]
+        max_shape += list(domain[len(dims) :])
+        nbytes = int(numpy.prod(max_shape, dtype=int)) * numpy.dtype(dtype).itemsize
+        return max(1, min(max_shape[0], -(-nbytes // self.pipeline_nbytes)))
 
     def save(self, array, header=None, offset=None):
         """
@@ -162,13 +284,16 @@ class MpiIO:
             else:
                 offset = 0
 
-        if self.rank == 0 and header:
-            self.handler.Write(header)
+        if header:
+            # collective write of the header with only the root providing data.
+            # Resetting the view since it may have been changed by previous calls.
+            self.handler.Set_view(0, self.MPI.BYTE, self.MPI.BYTE, datarep="native")
+            self.handler.Write_at_all(0, header if self.rank == 0 else b"")
 
-        self._set_view(array.shape, array.dtype, "C", offset, compose=True)
+        offset = self._set_view(array.shape, array.dtype, "C", offset, compose=True)
 
         # collectively write the array to file
-        self.handler.Write_all(self._array_view(array))
+        self.handler.Write_at_all(offset, self._array_view(array))
 
     def _file_open(self, mode=None):
         if mode is None:
@@ -184,6 +309,10 @@ class MpiIO:
         self.handler.Close()
 
     def _set_view(self, domain, dtype, order, pos, compose=None):
+        """
+        Sets the file view of the local domain starting at byte `pos`.
+        Returns the offset, in units of dtype, of the local domain in the view.
+        """
 
         if compose is True:
             sizes, subsizes, starts = self.decomposition.compose(domain)
@@ -198,27 +327,44 @@ class MpiIO:
         else:
             raise NotImplementedError("Currently noy supporting FORTRAN ordering")
 
-        # use fixed data-type
-        filetype = etype.Create_subarray(sizes, subsizes, starts, order=mpi_order)
-        filetype.Commit()
+        if tuple(subsizes[1:]) == tuple(sizes[1:]):
+            # only the slowest index is decomposed, i.e. the local domain is
+            # contiguous in the file and no derived data-type is needed
+            self.handler.Set_view(pos, etype, etype, datarep="native")
+            return int(numpy.prod(sizes[1:], dtype=int) * starts[0])
+
+        # use fixed data-type, committed once per decomposition
+        key = (sizes, subsizes, starts, numpy.dtype(dtype).str, mpi_order)
+        filetype = self._filetypes.get(key)
+        if filetype is None:
+            if len(self._filetypes) >= self.max_filetypes:
+                # freeing the least recently committed one
+                self._filetypes.pop(next(iter(self._filetypes))).Free()
+            filetype = etype.Create_subarray(sizes, subsizes, starts, order=mpi_order)
+            filetype.Commit()
+            self._filetypes[key] = filetype
 
         self.handler.Set_view(pos, etype, filetype, datarep="native")
+        return 0
 
-    def _to_mpi_file_mode(self, mode):
-        MPI = self.MPI
-
-        switcher = {
-            "r": MPI.MODE_RDONLY,
-            "w": MPI.MODE_CREATE | MPI.MODE_WRONLY,
-            "a": MPI.MODE_APPEND,
-            "r+": MPI.MODE_RDWR,
-            "w+": MPI.MODE_CREATE | MPI.MODE_RDWR,
-        }
+    def _free_filetypes(self):
+        "Frees the committed filetypes"
+        if self._filetypes and not self.MPI.Is_finalized():
+            for filetype in self._filetypes.values():
+                filetype.Free()
+        self._filetypes.clear()
 
-        if switcher.get(mode) is None:
-            raise ValueError("File access mode value is invalid.")
+    def _to_mpi_file_mode(self, mode):
+        "Converts a file mode, either a string or a combination of MPI.MODE_*"
+        if isinstance(mode, int):
+            if mode & ~_mpi_file_flags():
+                raise ValueError("File access mode value is invalid.")
+            return mode
 
-        return switcher.get(mode)
+        try:
+            return _mpi_file_modes()[mode]
+        except (KeyError, TypeError) as err:
+            raise ValueError("File access mode value is invalid.") from err
 
     def _array_view(self, array):
         "Array view for MPI functions"
@@ -243,22 +389,12 @@ class MpiIO:
         if np_type.byteorder == ">":
             np_type = np_type.newbyteorder("<")
 
-        if hasattr(self.MPI, "_typedict"):
-            types = self.MPI._typedict
-        elif hasattr(self.MPI, "__TypeDict__"):
-            types = self.MPI.__TypeDict__
-        else:
-            raise RuntimeError("Types dict not found")
-
-        for key, val in types.items():
-            try:
-                if numpy.dtype(key) == np_type:
-                    return key if get_key else val
-            # for keys that are not understood
-            except TypeError:
-                continue
+        try:
+            key, val = _mpi_typedict()[np_type]
+        except KeyError as err:
+            raise TypeError(f"{np_type} is not supported") from err
 
-        raise TypeError(f"{np_type} is not supported")
+        return key if get_key else val
 
     class _FileWrapper:
         """
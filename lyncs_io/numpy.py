@@ -13,11 +13,16 @@ __all__ = [
     "savez",
 ]
 
+import pickle
+import struct
 from io import UnsupportedOperation, BytesIO
-from functools import wraps
+from functools import wraps, lru_cache
 import numpy
 from numpy.lib.npyio import NpzFile
 from numpy.lib.format import (
+    ARRAY_ALIGN,
+    MAGIC_LEN,
+    magic,
     read_magic,
     _check_version,
     _read_array_header,
@@ -34,6 +39,10 @@ from .dask_io import DaskIO
 loadtxt = numpy.loadtxt
 savetxt = swap(numpy.savetxt)
 
+# constants of the version 1.0 header
+_MAGIC_1_0 = magic(1, 0)
+_PREFIX_LEN = MAGIC_LEN + struct.calcsize("<H")
+
 
 @wraps(numpy.load)
 def load(filename, chunks=None, comm=None, **kwargs):
@@ -50,6 +59,9 @@ def load(filename, chunks=None, comm=None, **kwargs):
         How to divide the data domain. This enables the Dask API.
     comm: MPI.Cartcomm
         A valid cartesian MPI Communicator.
+    mmap_mode: str
+        Memory-map the file, see numpy.load. Also honored when the
+        communicator has a single process.
 
 
     Returns:
@@ -77,7 +89,11 @@ def load(filename, chunks=None, comm=None, **kwargs):
     if comm is not None:
         check_comm(comm)
 
-        metadata = head(filename)
+        if comm.size == 1:
+            # no need of MPI-IO: mmap_mode is forwarded only if given
+            return numpy.load(filename, **kwargs)
+
+        metadata = _bcast_head(filename, comm)
         with MpiIO(comm, filename, mode="r") as mpiio:
             return mpiio.load(
                 metadata["shape"],
@@ -89,6 +105,35 @@ def load(filename, chunks=None, comm=None, **kwargs):
     return numpy.load(filename, **kwargs)
 
 
+def _bcast_head(filename, comm):
+    """
+    Reads the header on the root only, avoiding concurrent small reads,
+    and broadcasts it. Errors are raised on all the processes.
+    """
+    metadata, error = None, None
+    if comm.rank == 0:
+        try:
+            metadata = head(filename)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            error = err
+
+    # the error is sent only if it can be pickled, otherwise bcast would fail
+    # on the root only and the other processes would hang
+    sent = error
+    if comm.rank == 0 and error is not None:
+        try:
+            pickle.dumps(error)
+        except Exception:  # pylint: disable=broad-exception-caught
+            sent = RuntimeError(repr(error))
+
+    metadata, sent = comm.bcast((metadata, sent), root=0)
+    if error is not None:
+        raise error
+    if sent is not None:
+        raise sent
+    return metadata
+
+
 @wraps(numpy.save)
 def save(array, filename, comm=None, **kwargs):
     """
@@ -106,6 +151,10 @@ def save(array, filename, comm=None, **kwargs):
         A valid cartesian MPI Communicator.
 
     """
+    if comm is None and not is_dask_array(array):
+        # serial save: the attributes are not needed
+        return numpy.save(filename, numpy.asarray(array, order="C"), **kwargs)
+
     array, attrs = to_array(array)
 
     if is_dask_array(array):
@@ -113,22 +162,55 @@ def save(array, filename, comm=None, **kwargs):
         header = _get_header_bytes(attrs)
         return daskio.save(array, header=header)
 
-    if comm is not None:
-        check_comm(comm)
-
-        with MpiIO(comm, filename, mode="w") as mpiio:
-            global_shape, _, _ = mpiio.decomposition.compose(array.shape)
-            attrs["shape"] = global_shape
-            header = _get_header_bytes(attrs)
-            return mpiio.save(array, header=header)
+    check_comm(comm)
 
-    return numpy.save(filename, array, **kwargs)
+    with MpiIO(comm, filename, mode="w") as mpiio:
+        global_shape, _, _ = mpiio.decomposition.compose(array.shape)
+        attrs["shape"] = global_shape
+        header = _get_header_bytes(attrs)
+        return mpiio.save(array, header=header)
 
 
 def _get_header_bytes(attrs):
+    "Returns the header of a numpy file for the given array attributes"
+    args = (attrs["shape"], attrs["fortran_order"], attrs["descr"])
+    try:
+        return _header_bytes(*args)
+    except TypeError:
+        # not cachable, e.g. the descr of structured dtypes is a list
+        return _header_bytes.__wrapped__(*args)
+
+
+@lru_cache(maxsize=16)
+def _header_bytes(shape, fortran_order, descr):
+    """
+    Returns the header of a numpy file in version 1.0.
+    Same as numpy's _write_array_header but specialized to the standard keys.
+    Cached since repeated saves usually have the same shape and dtype.
+    """
+    header = (
+        f"{{'descr': {descr!r}, "
+        f"'fortran_order': {fortran_order!r}, "
+        f"'shape': {shape!r}, }}"
+    )
+
+    try:
+        header = header.encode("latin1")
+    except UnicodeEncodeError:
+        header = None
+
+    if header is not None:
+        hlen = len(header) + 1
+        padlen = ARRAY_ALIGN - ((_PREFIX_LEN + hlen) % ARRAY_ALIGN)
+        if hlen + padlen < 2**16:
+            prefix = _MAGIC_1_0 + struct.pack("<H", hlen + padlen)
+            return prefix + header + b" " * padlen + b"\n"
+
+    # Leaving to numpy headers that need a newer version of the format
     stream = BytesIO()
-    keys = ["shape", "fortran_order", "descr"]
-    _write_array_header(stream, {key: attrs[key] for key in keys})
+    _write_array_header(
+        stream, {"shape": shape, "fortran_order": fortran_order, "descr": descr}
+    )
     return stream.getvalue()
 
 
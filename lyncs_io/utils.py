@@ -2,7 +2,8 @@
 Function utils
 """
 
-from functools import wraps
+from functools import wraps, lru_cache
+from itertools import count
 from pathlib import Path
 from os.path import splitext
 from collections import defaultdict
@@ -13,8 +14,9 @@ def find_file(filename):
     """
     Finds a file in the directory that has the same name
     as the parameter <filename>. If the file does not exist,
-    the directory is searched for <filename.*> instead, and if
-    only one match is found, that particular filename is returned.
+    <filename.ext> is looked for with the extensions of the known formats
+    and, if none exists, the directory is searched for <filename.*> instead.
+    If only one match is found, that particular filename is returned.
 
     """
 
@@ -29,11 +31,23 @@ def find_file(filename):
     if not path.parent.is_dir():
         return filename
 
-    # A list with files matching the following pattern: filename.*
+    # Looking first for filename.ext with the known extensions,
+    # to avoid scanning large directories
+    # pylint: disable=C0415
+    from .formats import formats
+
     potential_files = [
-        str(f) for f in path.parent.iterdir() if str(f).startswith(str(path))
+        str(f)
+        for f in (path.parent / (path.name + "." + ext) for ext in formats.extensions)
+        if f.exists()
     ]
 
+    # A list with files matching the following pattern: filename.*
+    if not potential_files:
+        potential_files = [
+            str(f) for f in path.parent.iterdir() if str(f).startswith(str(path))
+        ]
+
     if len(potential_files) == 1:
         return str(potential_files[0])
     if len(potential_files) > 1:
@@ -54,17 +68,36 @@ def is_dask_array(obj):
         return False
 
 
+@lru_cache(maxsize=None)
+def get_mpi():
+    """
+    Returns the mpi4py MPI module. It is imported once on first usage,
+    so that MPI is not initialized when importing lyncs_io.
+    """
+    try:
+        # pylint: disable=C0415
+        from mpi4py import MPI
+    except ImportError as err:
+        raise ImportError(
+            "MPI not available. Consider installing `lyncs_io[mpi]`."
+        ) from err
+
+    return MPI
+
+
 def swap(fnc):
     "Returns a wrapper that swaps the first two arguments of the function"
-    return wraps(fnc)(
-        lambda fname, data, *args, **kwargs: fnc(data, fname, *args, **kwargs)
-    )
+
+    @wraps(fnc)
+    def wrapper(fname, data, *args, **kwargs):
+        return fnc(data, fname, *args, **kwargs)
+
+    return wrapper
 
 
 def default_names(i=0):
     "Infinite generator of default names ('arrN') for entries of an archive."
-    yield f"arr{i}"
-    yield from default_names(i + 1)
+    return (f"arr{n}" for n in count(i))
 
 
 def nested_dict():
@@ -118,3 +118,6 @@ def test_MPI_decomposition_Decomposition_Cartesian(tempdir_MPI, procs, shape):
         assert dglobalsz == cglobalsz
         assert dlocalsz == clocalsz
         assert dstart == cstart
+
+    dec.free()
+    assert not dec._subcomms
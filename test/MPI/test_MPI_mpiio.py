@@ -80,6 +80,15 @@ def test_MPI_mpiio_file_handler(tempdir_MPI):
     with MpiIO(comm, ftmp, mode="w") as mpiio:
         assert mpiio.handler is not None
 
+    # MPI modes can be given directly
+    with MpiIO(comm, ftmp, mode=MPI.MODE_CREATE | MPI.MODE_RDWR) as mpiio:
+        assert mpiio.handler is not None
+
+    for mode in ["x", MPI.MODE_RDWR | 2**30]:
+        with pytest.raises(ValueError):
+            with MpiIO(comm, ftmp, mode=mode) as mpiio:
+                pass
+
 
 @mark_mpi
 @dtype_mpi_loop
@@ -111,11 +120,96 @@ def test_MPI_mpiio_load_from_comm(tempdir_MPI, dtype, lshape):
             header["shape"], header["dtype"], order(header), header["_offset"]
         )
         assert local_array.dtype.str != dtype
+        assert local_array.flags.owndata
 
     slc = tuple(slice(rank * lshape[i], (rank + 1) * lshape[i]) for i in range(1))
     assert (global_array[slc] == local_array).all()
 
 
+@mark_mpi
+@dtype_mpi_loop
+@lshape_loop
+def test_MPI_mpiio_load_async(tempdir_MPI, dtype, lshape):
+    from mpi4py import MPI
+
+    comm = get_comm()
+    rank = comm.rank
+    ftmp = tempdir_MPI + "/foo_mpiio_load_async.npy"
+
+    write_global_array(comm, ftmp, lshape, dtype=dtype)
+    global_array = numpy.load(ftmp)
+    header = np.head(ftmp)
+
+    with MpiIO(comm, ftmp, mode="r") as mpiio:
+        reqs, local_array = mpiio.load_async(
+            header["shape"], header["dtype"], order(header), header["_offset"]
+        )
+        assert all(isinstance(req, MPI.Request) for req in reqs)
+        MPI.Request.Waitall(reqs)
+
+    slc = tuple(slice(rank * lshape[i], (rank + 1) * lshape[i]) for i in range(1))
+    assert (global_array[slc] == local_array).all()
+
+
+@mark_mpi
+@lshape_loop
+@pytest.mark.parametrize("inner", [False, True])
+def test_MPI_mpiio_repeated_load(tempdir_MPI, lshape, inner):
+
+    # decomposing the second index needs a subarray filetype
+    size = get_comm().size
+    comm = get_cart(procs=[1, size] if inner else [size])
+    dims, _, coords = comm.Get_topo()
+    ftmp = tempdir_MPI + "/foo_mpiio_repeated_load.npy"
+
+    write_global_array(comm, ftmp, lshape, dtype="float64")
+    global_array = numpy.load(ftmp)
+    header = np.head(ftmp)
+
+    slices = tuple(
+        slice(coords[i] * lshape[i], (coords[i] + 1) * lshape[i])
+        for i in range(len(dims))
+    )
+    with MpiIO(comm, ftmp, mode="r") as mpiio:
+        for _ in range(3):
+            local_array = mpiio.load(
+                header["shape"], header["dtype"], order(header), header["_offset"]
+            )
+            assert (global_array[slices] == local_array).all()
+        # contiguous local domains are read without filetype
+        assert len(mpiio._filetypes) == (1 if inner and size > 1 else 0)
+
+
+@mark_mpi
+@lshape_loop
+@pytest.mark.parametrize("inner", [False, True])
+def test_MPI_mpiio_pipelined_load(tempdir_MPI, lshape, inner):
+
+    size = get_comm().size
+    comm = get_cart(procs=[1, size] if inner else [size])
+    dims, _, coords = comm.Get_topo()
+    ftmp = tempdir_MPI + "/foo_mpiio_pipelined_load.npy"
+
+    write_global_array(comm, ftmp, lshape, dtype="float64")
+    global_array = numpy.load(ftmp)
+    header = np.head(ftmp)
+
+    slices = tuple(
+        slice(coords[i] * lshape[i], (coords[i] + 1) * lshape[i])
+        for i in range(len(dims))
+    )
+    with MpiIO(comm, ftmp, mode="r") as mpiio:
+        # forcing a read per row of the slowest index
+        mpiio.pipeline_nbytes = 1
+        reqs, local_array = mpiio.load_async(
+            header["shape"], header["dtype"], order(header), header["_offset"]
+        )
+        assert len(reqs) == lshape[0]
+        mpiio.MPI.Request.Waitall(reqs)
+
+    assert (global_array[slices] == local_array).all()
+
+
 @mark_mpi
 @dtype_mpi_loop
 @lshape_loop
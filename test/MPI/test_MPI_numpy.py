@@ -1,4 +1,5 @@
 import numpy
+import pytest
 import lyncs_io as io
 
 from lyncs_io.testing import (
@@ -128,3 +129,50 @@ def test_MPI_save_cart(tempdir_MPI, dtype, lshape, procs, format):
 
     global_array = io.load(ftmp, format=format)
     assert (local_array == global_array[slices]).all()
+
+
+@mark_mpi
+def test_MPI_load_single_process(tempdir_MPI):
+    comm = get_comm().Split(get_comm().rank)
+    ftmp = tempdir_MPI + f"/mpiio_load_single_{get_comm().rank}.npy"
+
+    write_global_array(comm, ftmp, (6, 4), dtype="float64")
+    global_array = numpy.load(ftmp)
+
+    local_array = io.load(ftmp, comm=comm)
+    assert not isinstance(local_array, numpy.memmap)
+    assert local_array.flags.owndata
+    assert (global_array == local_array).all()
+
+    # copy-on-write: the array is writable without changing the file
+    local_array = io.load(ftmp, comm=comm, mmap_mode="c")
+    assert isinstance(local_array, numpy.memmap)
+    local_array[:] = 0
+    assert (global_array == numpy.load(ftmp)).all()
+
+
+@mark_mpi
+def test_MPI_load_single_process_then_save(tempdir_MPI):
+    comm = get_comm().Split(get_comm().rank)
+    ftmp = tempdir_MPI + f"/mpiio_load_save_single_{get_comm().rank}.npy"
+
+    write_global_array(comm, ftmp, (6, 4), dtype="float64")
+    global_array = numpy.load(ftmp)
+
+    local_array = io.load(ftmp, comm=comm)
+    io.save(local_array, ftmp)
+    assert (global_array == numpy.load(ftmp)).all()
+
+
+@mark_mpi
+def test_MPI_load_malformed(tempdir_MPI):
+    comm = get_comm()
+    ftmp = tempdir_MPI + "/mpiio_load_malformed.npy"
+    if comm.rank == 0:
+        with open(ftmp, "wb") as fp:
+            fp.write(b"not a numpy file")
+    comm.Barrier()
+
+    # the error is raised by all processes
+    with pytest.raises(ValueError):
+        io.load(ftmp, comm=comm)
@@ -13,3 +13,16 @@ def test_serial_error():
 
     with raises(ImportError):
         formats.get_format(filename="foo.bar")
+
+
+def test_serial_extensions():
+    formats = Formats()
+    formats.register("foo", extensions=["foo", "bar"])
+    formats.register("bar", extensions=["bar"])
+
+    assert formats.extensions["foo"] == "foo"
+    assert formats.get_format(filename="file.bar") == "foo"
+
+    # the extensions are updated when registering new formats
+    formats.register("baz", extensions=["baz"])
+    assert formats.get_format(filename="file.baz") == "baz"
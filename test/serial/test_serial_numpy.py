@@ -1,6 +1,8 @@
 import lyncs_io as io
 import numpy as np
 
+from lyncs_io.convert import to_array
+from lyncs_io.numpy import _get_header_bytes
 from lyncs_io.testing import dtype_loop, shape_loop, tempdir, generate_rand_arr
 from lyncs_utils import prod
 
@@ -18,6 +20,38 @@ def test_serial_numpy_with_npy(tempdir, dtype, shape):
     assert io.load(ftmp).dtype == io.head(ftmp)["dtype"]
 
 
+@dtype_loop
+@shape_loop
+def test_serial_numpy_header_bytes(tempdir, dtype, shape):
+    arr = generate_rand_arr(shape, dtype)
+    arr, attrs = to_array(arr)
+    header = _get_header_bytes(attrs)
+    assert len(header) % 64 == 0
+
+    ftmp = tempdir + "/foo.npy"
+    with open(ftmp, "wb") as fp:
+        fp.write(header)
+        fp.write(arr.tobytes())
+
+    assert io.head(ftmp)["_offset"] == len(header)
+    assert (arr == np.load(ftmp)).all()
+
+    # headers are cached by shape, order and dtype
+    assert _get_header_bytes(dict(attrs)) is header
+
+
+def test_serial_numpy_header_bytes_structured(tempdir):
+    arr = np.zeros(4, dtype=[("x", "f8"), ("y", "i4")])
+    arr, attrs = to_array(arr)
+
+    ftmp = tempdir + "/foo.npy"
+    with open(ftmp, "wb") as fp:
+        fp.write(_get_header_bytes(attrs))
+        fp.write(arr.tobytes())
+
+    assert (arr == np.load(ftmp)).all()
+
+
 @dtype_loop
 @shape_loop
 def test_serial_numpy_with_npyz(tempdir, dtype, shape):
@@ -6,8 +6,16 @@ Tests for utils.py
 # pylint: disable=C0116
 
 import tarfile
+from itertools import islice
 import pytest
-from lyncs_io.utils import find_file, get_depth, find_member, format_key
+from lyncs_io.utils import (
+    find_file,
+    get_depth,
+    find_member,
+    format_key,
+    default_names,
+    swap,
+)
 from lyncs_io.testing import tempdir
 from lyncs_io.base import save
 
@@ -32,6 +40,22 @@ def test_find_file(tempdir):
         assert find_file(data) is data
 
 
+def test_find_file_extensions(tempdir):
+    # a known extension is preferred to other files with the same prefix
+    open(tempdir + "foo.npy", "w")
+    open(tempdir + "foo.npy.bak", "w")
+    assert find_file(tempdir + "foo") == tempdir + "foo.npy"
+
+    # two known extensions are still ambiguous
+    open(tempdir + "foo.h5", "w")
+    with pytest.raises(ValueError):
+        find_file(tempdir + "foo")
+
+    # unknown extensions are found scanning the directory
+    open(tempdir + "bar.unknown", "w")
+    assert find_file(tempdir + "bar") == tempdir + "bar.unknown"
+
+
 def test_find_member(tempdir):
     arr = None
     path = tempdir + "tarball.tar"
@@ -80,3 +104,20 @@ def test_get_depth():
 
     key = "user/bar/.."
     assert get_depth(path, key) == 1
+
+
+def test_default_names():
+    assert list(islice(default_names(), 3)) == ["arr0", "arr1", "arr2"]
+    assert next(default_names(5)) == "arr5"
+    # deep iteration must not hit the recursion limit
+    assert next(islice(default_names(), 5000, None)) == "arr5000"
+
+
+def test_swap():
+    def fnc(data, fname, *args, **kwargs):
+        "Test function"
+        return data, fname, args, kwargs
+
+    swapped = swap(fnc)
+    assert swapped("file", "data", 1, key=2) == ("data", "file", (1,), {"key": 2})
+    assert swapped.__doc__ == fnc.__doc__